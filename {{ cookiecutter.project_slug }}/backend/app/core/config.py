@@ -2,6 +2,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+from functools import cached_property, lru_cache
 from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
@@ -21,6 +22,13 @@ class Settings(BaseSettings):
     LOG_DIR: Path = Field(default=BASE_DIR / "logs")
     LOG_FILE_MAX_BYTES: int = Field(default=10 * 1024 * 1024) # 10MB
     LOG_FILE_BACKUP_COUNT: int = Field(default=5)
+    # Records buffered before a file write (WARNING and above flush immediately).
+    # Buffered records are lost on a hard crash; 0 writes every record directly.
+    LOG_BUFFER_CAPACITY: int = Field(default=64)
+    LOG_ROTATION_MODE: Literal["on_open", "on_emit"] = Field(default="on_emit") # When to check the log file size
+
+    # API Key Authentication
+    MASTER_API_KEY_SHA256: Optional[str] = Field(default=None) # Hex SHA-256 of the master API key (see tools/generate_api_key.py)
 
     {% if cookiecutter.use_postgres == 'y' %}
     # PostgreSQL Configuration
@@ -75,12 +83,32 @@ class Settings(BaseSettings):
         env_file = ".env.local"
         env_file_encoding = "utf-8"
         case_sensitive = False
-        ignore_extra = True
+        extra = "ignore"
     
     @property
     def is_production(self) -> bool:
         return self.ENVIRONMENT == "production"
 
-settings = Settings()
+    @cached_property
+    def MASTER_API_KEY_SHA256_BYTES(self) -> bytes:
+        """Normalized (stripped, lowercase) master API key hash as ASCII bytes, computed once."""
+        return (self.MASTER_API_KEY_SHA256 or "").strip().lower().encode("ascii")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    The settings are built once per process (env file parse + validation)
+    and cached.
+
+    Returns:
+        Settings: Cached settings instance
+    """
+    return Settings()
+
+
+settings = get_settings()
 
-__all__ = ["settings"]
\ No newline at end of file
+__all__ = ["settings", "get_settings", "Settings"]
\ No newline at end of file
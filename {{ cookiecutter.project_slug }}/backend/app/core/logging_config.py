@@ -1,12 +1,113 @@
 """
 Centralized logging configuration for the application.
 Configures logging to both console and file outputs with proper formatting and rotation.
+
+Records are handed off to a background thread through a queue, so console and
+file I/O (including rotation checks) never run on the request path.
 """
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-based rotating file handler that tracks the file size in-process.
+    
+    The standard RotatingFileHandler checks the file on disk on every emit to
+    decide whether to roll over. This handler reads the size once when opened and
+    then counts the characters it writes, only rotating when the count reaches
+    maxBytes. Sizes are approximate for non-ASCII output, as with the stdlib check.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bytes_written = (
+            os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        )
+        self._pending_bytes = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Decide on rollover using the in-process byte counter (no filesystem access)."""
+        if self.maxBytes <= 0:
+            return False
+        self._pending_bytes = len(self.format(record)) + len(self.terminator)
+        return self._bytes_written > 0 and self._bytes_written + self._pending_bytes >= self.maxBytes
+    
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self._bytes_written += self._pending_bytes
+
+
+class OpenTimeRotatingFileHandler(logging.FileHandler):
+    """
+    File handler that only checks for rotation when the file is opened.
+    
+    The file size is checked once at startup and the file is rotated if it is
+    over maxBytes; after that, emitting costs the same as a plain FileHandler.
+    Size bounds are loose: a long-lived process can grow the file past maxBytes
+    until it restarts.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0, **kwargs):
+        if maxBytes > 0 and os.path.exists(filename) and os.path.getsize(filename) >= maxBytes:
+            if backupCount > 0:
+                self._rotate(filename, backupCount)
+            else:
+                # No backups to keep, start the file over
+                kwargs["mode"] = "w"
+        super().__init__(filename, **kwargs)
+    
+    @staticmethod
+    def _rotate(filename: str, backup_count: int) -> None:
+        """Shift filename.N backups (like RotatingFileHandler) and move the file to .1."""
+        for i in range(backup_count - 1, 0, -1):
+            source = f"{filename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{filename}.{i + 1}")
+        os.replace(filename, f"{filename}.1")
+
+
+# Background listener that owns the real (console/file) handlers
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_listener_running: bool = False
+# Process that started the listener; a forked child inherits the flag but not the thread
+_listener_pid: Optional[int] = None
+
+
+def _resolve_level(log_level: str) -> int:
+    """
+    Convert a level name (case-insensitive) to its numeric value.
+    
+    Args:
+        log_level: Level name such as "INFO"
+    
+    Returns:
+        Numeric logging level
+    
+    Raises:
+        ValueError: If the name is not a registered logging level
+    """
+    name = log_level.upper()
+    get_mapping = getattr(logging, "getLevelNamesMapping", None)  # Python 3.11+
+    if get_mapping is not None:
+        level = get_mapping().get(name)
+    else:
+        # getLevelName maps known names to numbers and unknown ones to "Level <name>"
+        level = logging.getLevelName(name)
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {log_level!r}")
+    return level
 
 
 def setup_logging(
@@ -14,24 +115,47 @@ def setup_logging(
     log_file_path: Optional[str] = None,
     service_name: str = "app",
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    buffer_capacity: int = 64,
+    rotation_mode: str = "on_emit"
 ) -> logging.Logger:
     """
     Configure logging for the application with both console and file handlers.
     
+    The root logger only gets a QueueHandler; the console and file handlers run
+    on a QueueListener thread. Call `stop_logging()` on shutdown to drain the queue
+    and `start_logging()` to resume it (e.g. when the app is started again).
+    
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file_path: Path to the log file. If None, only console logging is enabled.
         service_name: Name of the service (used for logger name)
         max_bytes: Maximum size of each log file before rotation (default 10MB)
         backup_count: Number of backup files to keep (default 5)
+        buffer_capacity: Number of records buffered before writing to the log file
+            (default 64). Records of level WARNING or above flush the buffer immediately.
+            Buffered records are lost if the process is killed (e.g. SIGKILL or a
+            crash), so keep this small on low-traffic services, or use 0 to write
+            every record directly.
+        rotation_mode: When to check the file size for rotation. "on_emit" (default)
+            tracks the size as records are written; "on_open" only checks once
+            when the file is opened, which is cheaper but lets the file grow past
+            max_bytes until the next restart.
     
     Returns:
         Configured logger instance
     """
+    global _queue_listener, _queue_handler
+    
+    # Stop a previous listener (if any) so reconfiguring does not leak threads
+    stop_logging()
+    
+    # Resolve the numeric level once and reuse it for every handler
+    level = _resolve_level(log_level)
+    
     # Get the root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
@@ -47,35 +171,66 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    handlers: List[logging.Handler] = []
+    
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler with rotation (if log file path is provided)
+    file_logging_error: Optional[Exception] = None
     if log_file_path:
         try:
             # Ensure the log directory exists
             log_path = Path(log_file_path)
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = RotatingFileHandler(
+    
+            file_handler_class = (
+                OpenTimeRotatingFileHandler if rotation_mode == "on_open" else FastRotatingFileHandler
+            )
+            file_handler = file_handler_class(
                 filename=log_file_path,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
                 encoding='utf-8'
             )
-            file_handler.setLevel(getattr(logging, log_level.upper()))
+            file_handler.setLevel(level)
             file_handler.setFormatter(detailed_formatter)
-            root_logger.addHandler(file_handler)
-            
-            root_logger.info(f"File logging enabled: {log_file_path}")
-            root_logger.info(f"Log rotation: max_bytes={max_bytes}, backup_count={backup_count}")
-            
+    
+            if buffer_capacity > 0:
+                # Batch file writes; the buffer is flushed on close, which the
+                # logging module already does at interpreter exit (logging.shutdown)
+                buffered_handler = MemoryHandler(
+                    capacity=buffer_capacity,
+                    flushLevel=logging.WARNING,
+                    target=file_handler,
+                    flushOnClose=True
+                )
+                buffered_handler.setLevel(level)
+                handlers.append(buffered_handler)
+            else:
+                handlers.append(file_handler)
+    
         except Exception as e:
-            root_logger.error(f"Failed to setup file logging: {e}")
-            root_logger.warning("Continuing with console logging only")
+            file_logging_error = e
+    
+    # Only the queue handler runs on the caller's thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    start_logging()
+    
+    if file_logging_error is not None:
+        root_logger.error(f"Failed to setup file logging: {file_logging_error}")
+        root_logger.warning("Continuing with console logging only")
+    elif log_file_path:
+        root_logger.info(f"File logging enabled: {log_file_path}")
+        root_logger.info(f"Log rotation: mode={rotation_mode}, max_bytes={max_bytes}, backup_count={backup_count}")
+        root_logger.info(f"Log buffering: capacity={buffer_capacity}")
     
     # Create a named logger for the service
     service_logger = logging.getLogger(service_name)
@@ -83,6 +238,79 @@ def setup_logging(
     return service_logger
 
 
+def start_logging() -> None:
+    """
+    Start the background logging listener configured by `setup_logging()`.
+    
+    Records queued while the listener was stopped are processed once it restarts.
+    In a forked child (e.g. gunicorn --preload or Celery prefork workers) the
+    inherited listener has no thread, so it is rebuilt on a fresh queue first.
+    Safe to call multiple times.
+    """
+    global _listener_running, _listener_pid
+    
+    if _queue_listener is None:
+        return
+    
+    if _listener_running and _listener_pid != os.getpid():
+        _rebuild_listener()
+    
+    if not _listener_running:
+        _queue_listener.start()
+        _listener_running = True
+        _listener_pid = os.getpid()
+
+
+def _rebuild_listener() -> None:
+    """
+    Replace an inherited listener with a new one on a new queue.
+    
+    Threads do not survive fork(), and the parent's queue may hold records (or a
+    lock) from the parent, so the child gets its own queue and listener reusing
+    the same console/file handlers.
+    """
+    global _queue_listener, _listener_running
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _queue_listener = QueueListener(log_queue, *_queue_listener.handlers, respect_handler_level=True)
+    _listener_running = False
+
+
+def _restart_logging_after_fork() -> None:
+    """Restart logging in a forked child if it was running in the parent."""
+    if _listener_running:
+        start_logging()
+
+
+def stop_logging() -> None:
+    """
+    Stop the background logging listener, flushing any queued records.
+    
+    Safe to call multiple times.
+    """
+    global _listener_running
+    
+    if _queue_listener is not None and _listener_running:
+        if _listener_pid != os.getpid():
+            # Inherited across fork(): there is no thread to stop in this process
+            _rebuild_listener()
+            return
+        _queue_listener.stop()
+        _listener_running = False
+        # Push out records still held in buffering handlers (e.g. MemoryHandler)
+        for handler in _queue_listener.handlers:
+            handler.flush()
+
+
+# Drain queued records before logging.shutdown() runs at exit (atexit is LIFO)
+atexit.register(stop_logging)
+
+# Give forked workers their own listener thread (POSIX only)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_logging_after_fork)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance by name.
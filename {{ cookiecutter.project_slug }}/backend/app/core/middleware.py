@@ -2,284 +2,302 @@
 Custom middleware for the FastAPI application.
 
 This module contains middleware for request logging, error handling,
-and other cross-cutting concerns.
+and other cross-cutting concerns. All middleware is written as plain ASGI
+classes (no BaseHTTPMiddleware) to keep per-request overhead low.
 """
 import time
 import logging
+import threading
 import uuid
-from typing import Callable
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
-from fastapi.middleware.base import BaseHTTPMiddleware
-from fastapi.types import ASGIApp
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Tuple, Type
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# The environment does not change during the process lifetime
+IS_PRODUCTION: bool = settings.is_production
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Security headers added to every response
+_BASE_SECURITY_HEADERS: Dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+}
+
+# HSTS is only sent in production
+_PROD_SECURITY_HEADERS: Dict[str, str] = {
+    **_BASE_SECURITY_HEADERS,
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+}
+
+_SECURITY_HEADERS: Dict[str, str] = (
+    _PROD_SECURITY_HEADERS if IS_PRODUCTION else _BASE_SECURITY_HEADERS
+)
+
+# Known exception types mapped to (status code, error label); anything else is a 500
+_ERROR_MAP: Dict[Type[Exception], Tuple[int, str]] = {
+    ValueError: (status.HTTP_400_BAD_REQUEST, "Bad Request"),
+    PermissionError: (status.HTTP_403_FORBIDDEN, "Forbidden"),
+    FileNotFoundError: (status.HTTP_404_NOT_FOUND, "Not Found"),
+}
+
+
+class ObservabilityMiddleware:
     """
-    Middleware to log all incoming requests and outgoing responses.
+    Pure ASGI middleware for request logging, error handling and security headers.
+    
+    These used to be three BaseHTTPMiddleware classes; fusing them into one
+    ASGI layer avoids an extra task, response wrapper and coroutine hop per
+    middleware on every request.
     
-    Logs:
-    - Request method, path, query params
-    - Request ID for tracing
-    - Processing time
-    - Response status code
+    For every HTTP request it:
+    - Generates a request ID (available as `request.state.request_id`)
+    - Logs the request start, completion status and processing time
+    - Adds X-Request-ID, X-Process-Time and security headers to the response
+    - Converts uncaught exceptions into standardized JSON error responses
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process the request and log details.
+        Process the request, log details and handle any exceptions.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-        
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Generate unique request ID (exposed through request.state)
+        request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
         
         # Log request
-        start_time = time.time()
+        start_time = time.perf_counter()
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
         logger.info(
-            f"Request started | "
-            f"ID: {request_id} | "
-            f"Method: {request.method} | "
-            f"Path: {request.url.path} | "
-            f"Client: {request.client.host if request.client else 'unknown'}"
+            "Request started | ID: %s | Method: %s | Path: %s | Client: %s",
+            request_id,
+            scope["method"],
+            scope["path"],
+            client_host,
         )
         
-        # Process request
-        try:
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Add custom headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{process_time:.4f}"
-            
-            # Log response
-            logger.info(
-                f"Request completed | "
-                f"ID: {request_id} | "
-                f"Status: {response.status_code} | "
-                f"Duration: {process_time:.4f}s"
-            )
-            
-            return response
-            
-        except Exception as e:
-            # Log error
-            process_time = time.time() - start_time
-            logger.error(
-                f"Request failed | "
-                f"ID: {request_id} | "
-                f"Error: {str(e)} | "
-                f"Duration: {process_time:.4f}s",
-                exc_info=True
-            )
-            raise
-
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to handle uncaught exceptions and return proper JSON responses.
-    
-    Catches any unhandled exceptions and returns a standardized error response.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process the request and handle any exceptions.
+        status_code = None
         
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                
+                # Add custom and security headers (HSTS included in production)
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{time.perf_counter() - start_time:.4f}"
+                headers.update(_SECURITY_HEADERS)
+            await send(message)
         
-        Returns:
-            Response: HTTP response or error response
-        """
+        # Process request
         try:
-            response = await call_next(request)
-            return response
-            
-        except ValueError as e:
-            logger.warning(f"ValueError in request: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "error": "Bad Request",
-                    "message": str(e),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
-            )
-            
-        except PermissionError as e:
-            logger.warning(f"PermissionError in request: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "error": "Forbidden",
-                    "message": str(e),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
-            )
-            
-        except FileNotFoundError as e:
-            logger.warning(f"FileNotFoundError in request: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": "Not Found",
-                    "message": str(e),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
-            )
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Log the full exception
+            # Log error
+            process_time = time.perf_counter() - start_time
             logger.error(
-                f"Unhandled exception in request: {str(e)}",
+                "Request failed | ID: %s | Error: %s | Duration: %.4fs",
+                request_id,
+                e,
+                process_time,
                 exc_info=True
             )
             
-            # Return different response based on environment
-            if settings.ENVIRONMENT == "production":
-                error_message = "An internal error occurred"
-            else:
-                error_message = str(e)
+            # Too late to send an error response if the response already started
+            if status_code is not None:
+                raise
             
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "Internal Server Error",
-                    "message": error_message,
-                    "request_id": getattr(request.state, "request_id", None)
-                }
-            )
+            response = _error_response(e, request_id)
+            await response(scope, receive, send_wrapper)
+            return
+        
+        # Log response
+        process_time = time.perf_counter() - start_time
+        logger.info(
+            "Request completed | ID: %s | Status: %s | Duration: %.4fs",
+            request_id,
+            status_code,
+            process_time,
+        )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+def _error_response(e: Exception, request_id: str) -> ORJSONResponse:
     """
-    Middleware to add security headers to all responses.
+    Build a standardized JSON error response for an uncaught exception.
+    
+    Args:
+        e: The uncaught exception
+        request_id: ID of the failed request
     
-    Adds headers like:
-    - X-Content-Type-Options
-    - X-Frame-Options
-    - X-XSS-Protection
-    - Strict-Transport-Security (in production)
+    Returns:
+        ORJSONResponse: Error response
     """
+    for exc_type, (status_code, error) in _ERROR_MAP.items():
+        if isinstance(e, exc_type):
+            logger.warning("%s in request: %s", exc_type.__name__, e)
+            message = str(e)
+            break
+    else:
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        error = "Internal Server Error"
+        # Return different message based on environment
+        message = "An internal error occurred" if IS_PRODUCTION else str(e)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process the request and add security headers.
-        
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-        
-        Returns:
-            Response: HTTP response with security headers
-        """
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Add HSTS header in production
-        if settings.ENVIRONMENT == "production":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "error": error,
+            "message": message,
+            "request_id": request_id
+        }
+    )
 
 
 class RateLimitInfo:
-    """Simple rate limit tracking (in-memory, for demonstration)."""
+    """
+    Simple rate limit tracking (in-memory, for demonstration).
     
-    def __init__(self):
-        self.requests = {}
+    Args:
+        clock: Monotonic time source in seconds (injectable for tests)
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        # Least recently seen clients first, so the oldest can be evicted in O(1)
+        self.requests: OrderedDict[str, Deque[float]] = OrderedDict()
         self.window = 60  # 1 minute window
         self.max_requests = 100  # Max requests per window
+        self.max_clients = 50_000  # Max tracked clients (bounds memory)
+        self._last_cleanup = clock()
+        # The critical section is tiny, so a single lock is cheaper than sharding.
+        # It protects callers running in the threadpool (sync dependencies/routes).
+        self._lock = threading.Lock()
     
     def is_allowed(self, client_id: str) -> bool:
         """Check if request is allowed based on rate limit."""
-        current_time = time.time()
-        
-        if client_id not in self.requests:
-            self.requests[client_id] = []
-        
-        # Remove old requests outside the window
-        self.requests[client_id] = [
-            req_time for req_time in self.requests[client_id]
-            if current_time - req_time < self.window
+        with self._lock:
+            current_time = self._clock()
+            cutoff = current_time - self.window
+            
+            # Periodically drop clients that have been idle for a whole window
+            if current_time - self._last_cleanup > self.window:
+                self._cleanup(cutoff)
+                self._last_cleanup = current_time
+            
+            timestamps = self.requests.get(client_id)
+            if timestamps is None:
+                # Evict the least recently seen client when at capacity
+                if len(self.requests) >= self.max_clients:
+                    self.requests.popitem(last=False)
+                timestamps = deque()
+                self.requests[client_id] = timestamps
+            else:
+                self.requests.move_to_end(client_id)
+            
+            # Remove old requests outside the window (timestamps are ordered)
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            
+            # Check if under limit
+            if len(timestamps) < self.max_requests:
+                timestamps.append(current_time)
+                return True
+            
+            return False
+    
+    def _cleanup(self, cutoff: float) -> None:
+        """Remove clients without any request inside the current window."""
+        stale = [
+            client_id for client_id, timestamps in self.requests.items()
+            if not timestamps or timestamps[-1] <= cutoff
         ]
-        
-        # Check if under limit
-        if len(self.requests[client_id]) < self.max_requests:
-            self.requests[client_id].append(current_time)
-            return True
-        
-        return False
+        for client_id in stale:
+            del self.requests[client_id]
 
 
 # Global rate limit tracker (for demonstration; use Redis in production)
 rate_limiter = RateLimitInfo()
 
+# Paths excluded from rate limiting (health checks and docs)
+_RATE_LIMIT_SKIP_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+_RATE_LIMIT_SKIP_PREFIX = "/health"
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+
+class RateLimitMiddleware:
     """
-    Simple rate limiting middleware.
+    Simple rate limiting middleware (pure ASGI).
     
     Note: This uses in-memory storage and is suitable for single-instance deployments.
     For production with multiple instances, use Redis-based rate limiting.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and enforce rate limits.
         
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
+        Responds with 429 Too Many Requests when the client is over the limit.
         
-        Returns:
-            Response: HTTP response or 429 Too Many Requests
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Skip rate limiting for health checks and docs
-        if request.url.path.startswith("/health") or request.url.path in ["/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        path = scope["path"]
+        if path in _RATE_LIMIT_SKIP_PATHS or path.startswith(_RATE_LIMIT_SKIP_PREFIX):
+            await self.app(scope, receive, send)
+            return
         
         # Get client identifier
-        client_id = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
         
         # Check rate limit
         if not rate_limiter.is_allowed(client_id):
-            logger.warning(f"Rate limit exceeded for client: {client_id}")
-            return JSONResponse(
+            logger.warning("Rate limit exceeded for client: %s", client_id)
+            response = ORJSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Too Many Requests",
                     "message": "Rate limit exceeded. Please try again later.",
-                    "request_id": getattr(request.state, "request_id", None)
+                    "request_id": scope.get("state", {}).get("request_id")
                 }
             )
+            await response(scope, receive, send)
+            return
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 __all__ = [
-    "RequestLoggingMiddleware",
-    "ErrorHandlingMiddleware",
-    "SecurityHeadersMiddleware",
+    "ObservabilityMiddleware",
     "RateLimitMiddleware",
 ]
 
@@ -1,14 +1,17 @@
 """
 Main FastAPI application entrypoint for {{ cookiecutter.project_name }}
 """
+import logging
+import re
+
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from contextlib import asynccontextmanager
 
-from app.core.config import settings
-from app.core.logging_config import setup_logging
+from app.core.config import settings, Settings
+from app.core.logging_config import setup_logging, start_logging, stop_logging
 
 # Configure logging with file output
 logger = setup_logging(
@@ -16,9 +19,17 @@ logger = setup_logging(
     log_file_path=str(settings.LOG_DIR / "backend.log"),
     service_name="{{ cookiecutter.project_slug }}",
     max_bytes=settings.LOG_FILE_MAX_BYTES,
-    backup_count=settings.LOG_FILE_BACKUP_COUNT
+    backup_count=settings.LOG_FILE_BACKUP_COUNT,
+    buffer_capacity=settings.LOG_BUFFER_CAPACITY,
+    rotation_mode=settings.LOG_ROTATION_MODE
 )
 
+# The environment does not change during the process lifetime
+_IS_PRODUCTION: bool = settings.is_production
+
+# Setting names whose values are masked when logged
+_SECRET_RE = re.compile(r"password|key|secret|token", re.IGNORECASE)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -26,19 +37,22 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events.
     """
+    # Make sure the background logging listener runs (it is stopped on shutdown)
+    start_logging()
+
     logger.info("=" * 80)
     logger.info("Starting up application...")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info("=" * 80)
 
-    if settings.ENVIRONMENT == "development":
-        logger.info("Environment variables:")
-        for key, value in settings.model_dump().items():
+    if settings.ENVIRONMENT == "development" and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Environment variables:")
+        for key in Settings.model_fields:
             # Mask sensitive values
-            if any(secret in key.lower() for secret in ["password", "key", "secret", "token"]):
-                logger.info(f"{key}: ******")
+            if _SECRET_RE.search(key):
+                logger.debug("%s: ******", key)
             else:
-                logger.info(f"{key}: {value}")
+                logger.debug("%s: %s", key, getattr(settings, key))
 
     {% if cookiecutter.use_postgres == 'y' %}
     # Initialize database connection
@@ -68,39 +82,35 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down application...")
     logger.info("=" * 80)
 
+    # Drain the background logging queue
+    stop_logging()
+
 # Main application entrypoint
 app: FastAPI = FastAPI(
     title="{{ cookiecutter.project_name }}",
     version="0.0.0",
     description="{{ cookiecutter.project_description }}",
-    docs_url="/docs" if not settings.is_production else None,
-    redoc_url="/redoc" if not settings.is_production else None,
+    docs_url="/docs" if not _IS_PRODUCTION else None,
+    redoc_url="/redoc" if not _IS_PRODUCTION else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "{{ cookiecutter.author }}",
         "email": "{{ cookiecutter.email }}",
     }
 )
 
-# Include middleware (order matters - first added is outermost)
+# Include middleware (order matters - last added is outermost)
 from app.core.middleware import (
-    RequestLoggingMiddleware,
-    ErrorHandlingMiddleware,
-    SecurityHeadersMiddleware,
+    ObservabilityMiddleware,
     RateLimitMiddleware,
 )
 
-# Security headers (outermost)
-app.add_middleware(SecurityHeadersMiddleware)
-
-# Request logging
-app.add_middleware(RequestLoggingMiddleware)
-
 # Rate limiting (optional, uncomment to enable)
 # app.add_middleware(RateLimitMiddleware)
 
-# Error handling
-app.add_middleware(ErrorHandlingMiddleware)
+# Request logging, error handling and security headers (single ASGI layer)
+app.add_middleware(ObservabilityMiddleware)
 
 # CORS middleware
 app.add_middleware(
@@ -126,7 +136,7 @@ app.include_router(main_router)
 async def root():
     logger.info("Root endpoint called")
 
-    if not settings.is_production:
+    if not _IS_PRODUCTION:
         return RedirectResponse(url="/docs", status_code=307)
 
-    return JSONResponse(content={"title": "{{ cookiecutter.project_name }}", "status": "ok"}, status_code=200)
+    return ORJSONResponse(content={"title": "{{ cookiecutter.project_name }}", "status": "ok"}, status_code=200)
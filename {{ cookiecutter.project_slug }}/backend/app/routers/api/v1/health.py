@@ -1,9 +1,16 @@
 """
 Health check endpoints for monitoring application status.
 """
-from datetime import datetime
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 import sys
-from fastapi import APIRouter, status
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.schemas.api.v1.health import HealthResponse, DetailedHealthResponse
@@ -11,7 +18,7 @@ from app.schemas.api.v1.health import HealthResponse, DetailedHealthResponse
 from app.core.database import check_db_connection
 {% endif %}
 {% if cookiecutter.use_celery == 'y' %}
-from app.worker.client import get_worker_stats
+from app.worker.client import get_worker_count
 {% endif %}
 {% if cookiecutter.use_celery == 'y' %}
 from app.core.redis import get_redis_connection
@@ -20,9 +27,84 @@ import redis
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# Static for the lifetime of the process
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_APP_VERSION = "0.0.0"  # TODO: Load from package version
+
+
+def _prebuild_payload(status_value: str) -> Tuple[bytes, bytes]:
+    """
+    Pre-serialize a HealthResponse body around its timestamp.
+    
+    Only the timestamp changes between probes, so the rest of the JSON body is
+    encoded once and the timestamp is spliced in per request.
+    
+    Args:
+        status_value: Value of the "status" field
+    
+    Returns:
+        Tuple of (prefix, suffix) bytes surrounding the timestamp string
+    """
+    prefix = b'{"status":' + orjson.dumps(status_value) + b',"timestamp":"'
+    static_fields = orjson.dumps({
+        "version": _APP_VERSION,
+        "environment": settings.ENVIRONMENT,
+        "python_version": _PYTHON_VERSION,
+    })
+    # Drop the opening brace so the static fields continue the object
+    suffix = b'",' + static_fields[1:]
+    return prefix, suffix
+
+
+_HEALTHY_PREFIX, _HEALTHY_SUFFIX = _prebuild_payload("healthy")
+_ALIVE_PREFIX, _ALIVE_SUFFIX = _prebuild_payload("alive")
+_STARTED_PREFIX, _STARTED_SUFFIX = _prebuild_payload("started")
+
+# Formatted UTC timestamp, refreshed at most once per second
+_timestamp_cache: Dict[str, Any] = {"second": -1, "text": "", "value": b""}
+
+
+def _refresh_timestamp() -> None:
+    """Re-format the cached timestamp if the current second has changed."""
+    now = int(time.time())
+    if now != _timestamp_cache["second"]:
+        text = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _timestamp_cache["text"] = text
+        _timestamp_cache["value"] = text.encode()
+        _timestamp_cache["second"] = now
+
+
+def _utc_timestamp() -> bytes:
+    """
+    Get the current UTC time as ISO 8601 bytes, with one-second resolution.
+    
+    Returns:
+        Current UTC timestamp (e.g. b"2024-01-01T12:00:00Z")
+    """
+    _refresh_timestamp()
+    return _timestamp_cache["value"]
+
+
+def _utc_timestamp_str() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string, with one-second resolution.
+    
+    Returns:
+        Current UTC timestamp (e.g. "2024-01-01T12:00:00Z")
+    """
+    _refresh_timestamp()
+    return _timestamp_cache["text"]
+
+
+# Readiness service checks, refreshed in the background once older than the TTL
+_READINESS_CACHE_TTL = 10.0  # seconds
+_READINESS_CHECK_TIMEOUT = 1.0  # seconds, per service check
+_readiness_cache: Dict[str, Any] = {"status": None, "services": None, "updated_at": None}
+_readiness_refresh_task: Optional[asyncio.Task] = None
+
 
 @router.get("", response_model=HealthResponse, status_code=status.HTTP_200_OK)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     
@@ -30,146 +112,263 @@ async def health_check() -> HealthResponse:
     This endpoint should respond quickly and is suitable for
     load balancer health checks.
     
+    The body is pre-serialized (see `_prebuild_payload`); the response
+    model is only used for the OpenAPI schema.
+    
     Returns:
-        HealthResponse: Basic health information
-    """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-        version="0.0.0",  # TODO: Load from package version
-        environment=settings.ENVIRONMENT,
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        Response: Basic health information (HealthResponse JSON)
+    """
+    return Response(
+        content=_HEALTHY_PREFIX + _utc_timestamp() + _HEALTHY_SUFFIX,
+        media_type="application/json"
     )
 
 
 @router.get("/live", response_model=HealthResponse)
-async def liveness_check() -> HealthResponse:
+async def liveness_check() -> Response:
     """
     Kubernetes liveness probe endpoint.
     
     Indicates whether the application is running.
     If this fails, the container should be restarted.
     
+    The body is pre-serialized (see `_prebuild_payload`); the response
+    model is only used for the OpenAPI schema.
+    
     Returns:
-        HealthResponse: Liveness status
-    """
-    return HealthResponse(
-        status="alive",
-        timestamp=datetime.utcnow(),
-        version="0.0.0",
-        environment=settings.ENVIRONMENT,
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        Response: Liveness status (HealthResponse JSON)
+    """
+    return Response(
+        content=_ALIVE_PREFIX + _utc_timestamp() + _ALIVE_SUFFIX,
+        media_type="application/json"
     )
 
 
-@router.get("/ready", response_model=DetailedHealthResponse)
-async def readiness_check() -> DetailedHealthResponse:
-    """
-    Kubernetes readiness probe endpoint.
-    
-    Indicates whether the application is ready to serve traffic.
-    Checks dependencies like Redis, Celery workers, etc.
-    
-    Returns:
-        DetailedHealthResponse: Readiness status with service checks
-    """
-    services_status = {}
-    overall_status = "ready"
-    
-    {% if cookiecutter.use_postgres == 'y' %}
-    # Check PostgreSQL database
+{% if cookiecutter.use_postgres == 'y' %}
+def _check_database() -> Dict[str, Any]:
+    """Check the PostgreSQL database connection."""
     try:
         if check_db_connection():
-            services_status["database"] = {"status": "healthy", "type": "postgresql"}
-        else:
-            services_status["database"] = {"status": "unhealthy", "type": "postgresql"}
-            overall_status = "not_ready"
+            return {"status": "healthy", "type": "postgresql"}
+        return {"status": "unhealthy", "type": "postgresql"}
     except Exception as e:
-        services_status["database"] = {
+        return {
             "status": "unhealthy",
             "type": "postgresql",
             "error": str(e)
         }
-        overall_status = "not_ready"
-    
-    {% endif %}
-    {% if cookiecutter.use_celery == 'y' %}
-    # Check Redis
+
+
+{% endif %}
+{% if cookiecutter.use_celery == 'y' %}
+def _check_redis() -> Dict[str, Any]:
+    """Check the Redis connection."""
     try:
         redis_conn = get_redis_connection()
         redis_conn.ping()
-        services_status["redis"] = {"status": "healthy"}
+        return {"status": "healthy"}
     except (redis.ConnectionError, Exception) as e:
-        services_status["redis"] = {"status": "unhealthy", "error": str(e)}
-        overall_status = "not_ready"
-    
-    # Check Celery workers
+        return {"status": "unhealthy", "error": str(e)}
+
+
+def _check_celery() -> Dict[str, Any]:
+    """Check that at least one Celery worker is available."""
     try:
-        worker_stats = get_worker_stats()
-        worker_count = len(worker_stats.get("worker_stats", {}))
+        # Bounded broadcast ping, well inside _READINESS_CHECK_TIMEOUT
+        worker_count = get_worker_count(timeout=0.5)
         if worker_count > 0:
-            services_status["celery"] = {
+            return {
                 "status": "healthy",
                 "workers": worker_count
             }
-        else:
-            services_status["celery"] = {
-                "status": "unhealthy",
-                "workers": 0,
-                "error": "No workers available"
-            }
-            overall_status = "not_ready"
+        return {
+            "status": "unhealthy",
+            "workers": 0,
+            "error": "No workers available"
+        }
     except Exception as e:
-        services_status["celery"] = {
+        return {
             "status": "unhealthy",
             "error": str(e)
         }
-        overall_status = "not_ready"
-    {% endif %}
-    
-    {% if cookiecutter.use_supabase == 'y' %}
-    # Check Supabase connection
+
+
+{% endif %}
+{% if cookiecutter.use_supabase == 'y' %}
+def _check_supabase() -> Dict[str, Any]:
+    """Check the Supabase client."""
     try:
-        from app.core.supabase import get_supabase_client
-        supabase = get_supabase_client()
+        # Imported here so a missing or misconfigured Supabase setup reports unhealthy
+        # instead of breaking the import of this router
+        from app.core.supabase import get_admin_client
+        # Reuses the process-wide client (and its connection pool) after the first probe
+        get_admin_client()
         # Simple check - if client was created, assume healthy
-        services_status["supabase"] = {"status": "healthy"}
+        return {"status": "healthy"}
     except Exception as e:
-        services_status["supabase"] = {
+        return {
             "status": "unhealthy",
             "error": str(e)
         }
-        overall_status = "not_ready"
+
+
+{% endif %}
+# Service checks run by the readiness probe (blocking functions, run in `_readiness_executor`)
+_READINESS_CHECKS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    {% if cookiecutter.use_postgres == 'y' %}
+    "database": _check_database,
+    {% endif %}
+    {% if cookiecutter.use_celery == 'y' %}
+    "redis": _check_redis,
+    "celery": _check_celery,
     {% endif %}
+    {% if cookiecutter.use_supabase == 'y' %}
+    "supabase": _check_supabase,
+    {% endif %}
+}
+
+
+# Dedicated threads for the blocking checks, so a hung dependency cannot exhaust
+# the event loop's default executor
+_readiness_executor = ThreadPoolExecutor(
+    max_workers=max(len(_READINESS_CHECKS), 1),
+    thread_name_prefix="readiness",
+)
+# Check futures still running in the executor, by service name
+_readiness_inflight: Dict[str, Future] = {}
+
+
+async def _run_check(name: str, check: Callable[[], Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run a blocking service check in the readiness executor, bounded by a timeout.
     
-    return DetailedHealthResponse(
-        status=overall_status,
-        timestamp=datetime.utcnow(),
-        version="0.0.0",
-        environment=settings.ENVIRONMENT,
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-        services=services_status
+    A check that is still running from an earlier refresh is awaited again rather
+    than re-submitted, so a hung dependency holds at most one thread.
+    
+    Args:
+        name: Service name
+        check: Blocking check function returning the service status
+    
+    Returns:
+        Tuple of (service name, service status)
+    """
+    future = _readiness_inflight.get(name)
+    if future is None or future.done():
+        future = _readiness_executor.submit(check)
+        _readiness_inflight[name] = future
+    
+    try:
+        # Shield so the timeout does not cancel the shared future
+        result = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(future)),
+            timeout=_READINESS_CHECK_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        result = {"status": "unhealthy", "error": "timeout"}
+    except Exception as e:
+        result = {"status": "unhealthy", "error": str(e)}
+    return name, result
+
+
+async def _refresh_readiness_cache() -> None:
+    """
+    Probe the backing services concurrently and store the results in the readiness cache.
+    
+    Total time is bounded by the slowest check (at most `_READINESS_CHECK_TIMEOUT`).
+    """
+    results = await asyncio.gather(
+        *(_run_check(name, check) for name, check in _READINESS_CHECKS.items())
+    )
+    services_status = dict(results)
+    
+    if all(service["status"] == "healthy" for service in services_status.values()):
+        overall_status = "ready"
+    else:
+        overall_status = "not_ready"
+    
+    _readiness_cache["status"] = overall_status
+    _readiness_cache["services"] = services_status
+    _readiness_cache["updated_at"] = time.monotonic()
+
+
+def _schedule_readiness_refresh() -> None:
+    """
+    Refresh the readiness cache in the background (at most one refresh at a time).
+    """
+    global _readiness_refresh_task
+    
+    if _readiness_refresh_task is None or _readiness_refresh_task.done():
+        # Keep a reference so the task is not garbage collected while running
+        _readiness_refresh_task = asyncio.create_task(_refresh_readiness_cache())
+
+
+@router.get(
+    "/ready",
+    response_model=DetailedHealthResponse,
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": DetailedHealthResponse,
+            "description": "At least one backing service is unhealthy (status \"not_ready\")",
+        },
+    },
+)
+async def readiness_check() -> Response:
+    """
+    Kubernetes readiness probe endpoint.
+    
+    Indicates whether the application is ready to serve traffic.
+    Checks dependencies like Redis, Celery workers, etc.
+    
+    Service checks are cached for `_READINESS_CACHE_TTL` seconds. The first call
+    runs them inline; afterwards stale results are served immediately while a
+    background refresh runs, so slow dependencies do not slow down the probe.
+    
+    The body is serialized directly with orjson; the response model is only
+    used for the OpenAPI schema.
+    
+    Returns:
+        Response: Readiness status with service checks (DetailedHealthResponse JSON),
+        with status 503 when any service is unhealthy
+    """
+    updated_at = _readiness_cache["updated_at"]
+    if updated_at is None:
+        await _refresh_readiness_cache()
+    elif time.monotonic() - updated_at > _READINESS_CACHE_TTL:
+        _schedule_readiness_refresh()
+    
+    overall_status = _readiness_cache["status"]
+    return ORJSONResponse(
+        {
+            "status": overall_status,
+            "timestamp": _utc_timestamp_str(),
+            "version": _APP_VERSION,
+            "environment": settings.ENVIRONMENT,
+            "python_version": _PYTHON_VERSION,
+            "services": _readiness_cache["services"],
+        },
+        # Non-2xx takes the pod out of rotation while a dependency is down
+        status_code=status.HTTP_200_OK if overall_status == "ready" else status.HTTP_503_SERVICE_UNAVAILABLE,
     )
 
 
 @router.get("/startup", response_model=HealthResponse)
-async def startup_check() -> HealthResponse:
+async def startup_check() -> Response:
     """
     Kubernetes startup probe endpoint.
     
     Indicates whether the application has finished starting up.
     Use this for slow-starting applications.
     
+    The body is pre-serialized (see `_prebuild_payload`); the response
+    model is only used for the OpenAPI schema.
+    
     Returns:
-        HealthResponse: Startup status
+        Response: Startup status (HealthResponse JSON)
     """
     # For now, if the endpoint responds, we're started
-    return HealthResponse(
-        status="started",
-        timestamp=datetime.utcnow(),
-        version="0.0.0",
-        environment=settings.ENVIRONMENT,
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    return Response(
+        content=_STARTED_PREFIX + _utc_timestamp() + _STARTED_SUFFIX,
+        media_type="application/json"
     )
 
 
@@ -1,7 +1,6 @@
 """
 Schema models for health check endpoints.
 """
-from datetime import datetime
 from typing import Dict, Any
 from pydantic import BaseModel, Field
 
@@ -9,7 +8,7 @@ from pydantic import BaseModel, Field
 class HealthResponse(BaseModel):
     """Health check response model."""
     status: str = Field(..., description="Overall health status")
-    timestamp: datetime = Field(..., description="Current server time")
+    timestamp: str = Field(..., description="Current server time (ISO 8601, UTC)")
     version: str = Field(default="0.0.0", description="Application version")
     environment: str = Field(..., description="Current environment")
     python_version: str = Field(..., description="Python version")
@@ -18,7 +17,7 @@ class HealthResponse(BaseModel):
         "json_schema_extra": {
             "examples": [{
                 "status": "healthy",
-                "timestamp": "2024-01-01T12:00:00",
+                "timestamp": "2024-01-01T12:00:00Z",
                 "version": "1.0.0",
                 "environment": "development",
                 "python_version": "3.14.0"
@@ -30,7 +29,7 @@ class HealthResponse(BaseModel):
 class DetailedHealthResponse(BaseModel):
     """Detailed health check response model."""
     status: str
-    timestamp: datetime
+    timestamp: str
     version: str
     environment: str
     python_version: str
@@ -40,7 +39,7 @@ class DetailedHealthResponse(BaseModel):
         "json_schema_extra": {
             "examples": [{
                 "status": "healthy",
-                "timestamp": "2024-01-01T12:00:00",
+                "timestamp": "2024-01-01T12:00:00Z",
                 "version": "1.0.0",
                 "environment": "development",
                 "python_version": "3.14.0",
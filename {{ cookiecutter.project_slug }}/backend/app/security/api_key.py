@@ -10,11 +10,15 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
-def _sha256_hex(value: str) -> str:
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+def _sha256_hex(value: str) -> bytes:
+    # Hashed per request on purpose: caching would keep client-supplied keys in memory.
+    # Returned as ASCII bytes to compare against settings.MASTER_API_KEY_SHA256_BYTES.
+    return hashlib.sha256(value.encode("utf-8")).hexdigest().encode("ascii")
 
 
-# Dependency for API key validation
+# Dependency for API key validation.
+# Kept as `async def` on purpose: it does no blocking I/O, and FastAPI runs sync
+# (`def`) dependencies in the threadpool, which costs more than awaiting it inline.
 async def require_api_key(x_api_key: Optional[str] = Header(default=None, alias="X-API-Key")) -> None:
     """
     FastAPI dependency that verifies a provided API key against the
@@ -30,7 +34,7 @@ async def require_api_key(x_api_key: Optional[str] = Header(default=None, alias=
 
     # NOTE: This logic can be changed to use a more secure method of storing the API key, such as a JWT token.
     # NOTE: The API key can be stored in a more secure way, such as in a database.
-    expected_hash = (settings.MASTER_API_KEY_SHA256 or "").strip()
+    expected_hash = settings.MASTER_API_KEY_SHA256_BYTES
 
     if not expected_hash:
         if not settings.is_production:
@@ -43,7 +47,7 @@ async def require_api_key(x_api_key: Optional[str] = Header(default=None, alias=
 
     provided_hash = _sha256_hex(x_api_key)
 
-    if not hmac.compare_digest(provided_hash.lower(), expected_hash.lower()):
+    if not hmac.compare_digest(provided_hash, expected_hash):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid API key")
 
     # Authenticated. Nothing to return; dependency success is enough.
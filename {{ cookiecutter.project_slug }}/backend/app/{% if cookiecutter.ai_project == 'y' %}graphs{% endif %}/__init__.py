@@ -3,11 +3,11 @@ LangGraph agent workflows.
 
 This module contains the LangGraph-based agent workflows for AI functionality.
 """
-from app.graphs.workflow import graph, create_agent_workflow, AgentState
+from app.graphs.workflow import get_graph, create_agent_workflow, AgentState
 
 
 __all__ = [
-    "graph",
+    "get_graph",
     "create_agent_workflow",
     "AgentState",
 ]
@@ -4,13 +4,13 @@ LangGraph nodes for the agent workflow.
 This module contains node functions that define the behavior
 of different steps in the agent workflow.
 """
-from app.graphs.nodes.agent import agent_node, tool_node
+from app.graphs.nodes.agent import agent_node, get_tool_node
 from app.graphs.nodes.supervisor import should_continue
 
 
 __all__ = [
     "agent_node",
-    "tool_node",
+    "get_tool_node",
     "should_continue",
 ]
 
@@ -2,24 +2,32 @@
 Agent node for processing user requests.
 """
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import ToolNode
 
 from app.core.config import settings
 from app.graphs.tools import get_all_tools
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from langgraph.prebuilt import ToolNode
+
 logger = logging.getLogger(__name__)
 
 
-def get_llm():
+@lru_cache(maxsize=1)
+def get_llm() -> "ChatOpenAI":
     """
-    Get the configured LLM instance.
+    Get the configured LLM instance, created once and reused.
+    
+    `langchain_openai` is imported here so it is only loaded when the agent runs.
     
     Returns:
         ChatOpenAI instance
     """
+    from langchain_openai import ChatOpenAI
+    
     return ChatOpenAI(
         model=settings.LLM_MODEL or "gpt-4",
         api_key=settings.OPENAI_API_KEY,
@@ -27,7 +35,18 @@ def get_llm():
     )
 
 
-def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def get_llm_with_tools():
+    """
+    Get the LLM bound to all available tools, created once and reused.
+    
+    Returns:
+        Runnable LLM with the tool schemas bound
+    """
+    return get_llm().bind_tools(get_all_tools())
+
+
+async def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Agent node that processes the current state and decides what to do next.
     
@@ -44,10 +63,8 @@ def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
     
     messages = state.get("messages", [])
     
-    # Get LLM and tools
-    llm = get_llm()
-    tools = get_all_tools()
-    llm_with_tools = llm.bind_tools(tools)
+    # Get the LLM with tools bound (cached across invocations)
+    llm_with_tools = get_llm_with_tools()
     
     # Add system message if not present
     if not any(isinstance(msg, SystemMessage) for msg in messages):
@@ -57,10 +74,10 @@ def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         messages = [system_message] + messages
     
-    # Get response from LLM
-    response = llm_with_tools.invoke(messages)
+    # Get response from LLM (awaited, so the event loop stays free during the call)
+    response = await llm_with_tools.ainvoke(messages)
     
-    logger.info(f"Agent response: {response.content[:100]}...")
+    logger.info("Agent response: %s...", response.content[:100])
     
     # Update state with agent's response
     return {
@@ -68,9 +85,23 @@ def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-# Create tool node for executing tools
-tool_node = ToolNode(get_all_tools())
+@lru_cache(maxsize=1)
+def get_tool_node() -> "ToolNode":
+    """
+    Get the tool node for executing tools, created on first use.
+    
+    When the graph runs through `ainvoke`, ToolNode executes all tool calls from a
+    single agent message concurrently (asyncio.gather), so independent tools such
+    as search and calculator take as long as the slowest one, not their sum.
+    Keep tools free of shared side effects for this reason.
+    
+    Returns:
+        ToolNode wrapping all available tools
+    """
+    from langgraph.prebuilt import ToolNode
+    
+    return ToolNode(get_all_tools())
 
 
-__all__ = ["agent_node", "tool_node"]
+__all__ = ["agent_node", "get_tool_node", "get_llm", "get_llm_with_tools"]
 
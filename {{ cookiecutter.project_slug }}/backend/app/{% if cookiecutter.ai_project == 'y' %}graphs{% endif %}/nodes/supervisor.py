@@ -3,7 +3,6 @@ Supervisor node for controlling workflow execution.
 """
 import logging
 from typing import Dict, Any, Literal
-from langchain_core.messages import AIMessage, ToolMessage
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +21,16 @@ def should_continue(state: Dict[str, Any]) -> Literal["continue", "end"]:
     Returns:
         "continue" if tools need to be executed, "end" otherwise
     """
-    messages = state.get("messages", [])
+    messages = state.get("messages")
     
-    if not messages:
-        logger.info("No messages, ending workflow")
-        return "end"
+    # Only AI messages carry tool calls; a single attribute lookup covers every message type
+    tool_calls = getattr(messages[-1], "tool_calls", None) if messages else None
     
-    last_message = messages[-1]
+    if tool_calls:
+        logger.debug("Tool calls found: %d, continuing workflow", len(tool_calls))
+        return "continue"
     
-    # Check if last message has tool calls
-    if isinstance(last_message, AIMessage) and hasattr(last_message, "tool_calls"):
-        tool_calls = last_message.tool_calls
-        if tool_calls:
-            logger.info(f"Tool calls found: {len(tool_calls)}, continuing workflow")
-            return "continue"
-    
-    logger.info("No tool calls, ending workflow")
+    logger.debug("No tool calls, ending workflow")
     return "end"
 
 
@@ -4,6 +4,7 @@ LangChain tools for the agent.
 This module contains custom tools that can be used by LangChain agents
 in the workflow.
 """
+from functools import lru_cache
 from typing import List
 from langchain_core.tools import Tool
 
@@ -11,10 +12,13 @@ from app.graphs.tools.search import search_tool
 from app.graphs.tools.calculator import calculator_tool
 
 
+@lru_cache(maxsize=1)
 def get_all_tools() -> List[Tool]:
     """
     Get all available tools for the agent.
     
+    The tool list is static, so it is built once and shared; do not mutate it.
+    
     Returns:
         List of LangChain Tool instances
     """
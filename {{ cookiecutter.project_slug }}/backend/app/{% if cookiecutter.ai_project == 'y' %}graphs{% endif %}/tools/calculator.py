@@ -1,12 +1,58 @@
 """
 Calculator tool for the agent.
 """
+import ast
 import logging
+import operator
+from functools import lru_cache
 from typing import Union
 from langchain_core.tools import tool
 
 logger = logging.getLogger(__name__)
 
+# Supported operators (exponentiation is deliberately excluded)
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node: ast.AST) -> Union[int, float]:
+    """Evaluate a parsed arithmetic node, rejecting anything but numbers and basic operators."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+@lru_cache(maxsize=512)
+def _safe_eval(expression: str) -> Union[int, float]:
+    """
+    Evaluate an arithmetic expression without `eval`.
+    
+    The expression is parsed into an AST and walked directly, so only numbers,
+    +, -, *, /, // and parentheses are accepted. Results are cached per expression.
+    
+    Args:
+        expression: Mathematical expression to evaluate
+    
+    Returns:
+        The numeric result
+    """
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
 
 @tool
 def calculator_tool(expression: str) -> str:
@@ -22,7 +68,7 @@ def calculator_tool(expression: str) -> str:
     Returns:
         The result of the calculation as a string
     """
-    logger.info(f"Calculating: {expression}")
+    logger.info("Calculating: %s", expression)
     
     try:
         # Safety: Only allow basic mathematical operations
@@ -31,13 +77,13 @@ def calculator_tool(expression: str) -> str:
             return "Error: Expression contains invalid characters. Only numbers and basic operators (+, -, *, /, parentheses) are allowed."
         
         # Evaluate the expression
-        result = eval(expression)
-        logger.info(f"Result: {result}")
+        result = _safe_eval(expression)
+        logger.info("Result: %s", result)
         
         return str(result)
         
     except Exception as e:
-        logger.error(f"Calculation error: {str(e)}")
+        logger.error("Calculation error: %s", e)
         return f"Error calculating expression: {str(e)}"
 
 
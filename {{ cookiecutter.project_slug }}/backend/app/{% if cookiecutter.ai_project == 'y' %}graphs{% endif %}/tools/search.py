@@ -22,7 +22,7 @@ def search_tool(query: str) -> str:
     Returns:
         Search results as a string
     """
-    logger.info(f"Searching for: {query}")
+    logger.info("Searching for: %s", query)
     
     # TODO: Implement actual search functionality
     # This could integrate with Google Search API, DuckDuckGo, etc.
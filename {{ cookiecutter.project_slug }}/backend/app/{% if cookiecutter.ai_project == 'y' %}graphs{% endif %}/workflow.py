@@ -2,14 +2,16 @@
 LangGraph workflow definition.
 
 This module defines the agent workflow using LangGraph's StateGraph.
+The compiled graph is built on first use via `get_graph()`.
 """
 import logging
-from typing import TypedDict, Annotated, Sequence
+from functools import lru_cache
+from typing import Any, TypedDict, Annotated, Sequence
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 
-from app.graphs.nodes import agent_node, tool_node, should_continue
+from app.graphs.nodes import agent_node, get_tool_node, should_continue
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +45,7 @@ def create_agent_workflow() -> StateGraph:
     
     # Add nodes
     workflow.add_node("agent", agent_node)
-    workflow.add_node("tools", tool_node)
+    workflow.add_node("tools", get_tool_node())
     
     # Set entry point
     workflow.set_entry_point("agent")
@@ -67,9 +69,24 @@ def create_agent_workflow() -> StateGraph:
     return workflow.compile()
 
 
-# Create a singleton instance of the workflow
-graph: StateGraph = create_agent_workflow()
+@lru_cache(maxsize=1)
+def get_graph() -> StateGraph:
+    """
+    Get the compiled agent workflow, creating it on first call.
+    
+    Returns:
+        Compiled StateGraph ready for execution
+    """
+    return create_agent_workflow()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy `graph` attribute for loaders that reference the module-level graph
+    # (e.g. langgraph.json: "./app/graphs/workflow.py:graph")
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["graph", "create_agent_workflow", "AgentState"]
+__all__ = ["get_graph", "create_agent_workflow", "AgentState"]
 
@@ -5,8 +5,9 @@ This module provides helper functions to interact with Celery tasks
 from your FastAPI application.
 """
 import logging
-from typing import Optional, Dict, Any
-from celery.result import AsyncResult
+from typing import Optional, Dict, Any, List, Tuple
+from celery import chain, group
+from celery.result import AsyncResult, GroupResult
 
 from app.worker.main import celery_app
 
@@ -30,9 +31,62 @@ def submit_task(task_name: str, *args, **kwargs) -> AsyncResult:
         >>> print(result.id)
         >>> print(result.status)
     """
-    logger.info(f"Submitting task: {task_name} with args={args}, kwargs={kwargs}")
+    logger.info("Submitting task: %s with args=%s, kwargs=%s", task_name, args, kwargs)
     result = celery_app.send_task(task_name, args=args, kwargs=kwargs)
-    logger.info(f"Task submitted with ID: {result.id}")
+    logger.info("Task submitted with ID: %s", result.id)
+    return result
+
+
+def submit_tasks_batch(task_name: str, args_list: List[Tuple[Any, ...]]) -> GroupResult:
+    """
+    Submit many calls of the same task at once as a Celery group.
+    
+    One call builds and sends the whole group and returns a single GroupResult.
+    Celery still publishes one message per task call.
+    
+    Args:
+        task_name: Name of the task to execute
+        args_list: Positional arguments for each task call
+    
+    Returns:
+        GroupResult for tracking all tasks together
+    
+    Example:
+        >>> result = submit_tasks_batch('app.worker.tasks.add_numbers', [(1, 2), (3, 4)])
+        >>> print(result.id)
+        >>> print(result.completed_count())
+    """
+    logger.info("Submitting batch of %d %s tasks", len(args_list), task_name)
+    job = group([celery_app.signature(task_name, args=args) for args in args_list])
+    result = job.apply_async()
+    logger.info("Batch submitted with group ID: %s", result.id)
+    return result
+
+
+def submit_chain(tasks: List[Tuple[str, Tuple[Any, ...]]]) -> AsyncResult:
+    """
+    Submit dependent tasks as a Celery chain.
+    
+    Each task runs after the previous one and receives its result as the
+    first positional argument.
+    
+    Args:
+        tasks: (task_name, args) pairs, in execution order
+    
+    Returns:
+        AsyncResult of the last task in the chain
+    
+    Example:
+        >>> result = submit_chain([
+        >>>     ('app.worker.tasks.add_numbers', (1, 2)),
+        >>>     ('app.worker.tasks.add_numbers', (10,)),
+        >>> ])
+        >>> print(result.get())  # 13
+    """
+    logger.info("Submitting chain of %d tasks", len(tasks))
+    workflow = chain(*[celery_app.signature(task_name, args=args) for task_name, args in tasks])
+    result = workflow.apply_async()
+    logger.info("Chain submitted, final task ID: %s", result.id)
     return result
 
 
@@ -105,7 +159,7 @@ def revoke_task(task_id: str, terminate: bool = False) -> Dict[str, str]:
     Example:
         >>> revoke_task('some-task-id', terminate=True)
     """
-    logger.info(f"Revoking task: {task_id} (terminate={terminate})")
+    logger.info("Revoking task: %s (terminate=%s)", task_id, terminate)
     celery_app.control.revoke(task_id, terminate=terminate)
     return {"task_id": task_id, "status": "revoked"}
 
@@ -134,11 +188,31 @@ def get_worker_stats() -> Dict[str, Any]:
     return {"worker_stats": stats or {}}
 
 
+def get_worker_count(timeout: float = 0.5) -> int:
+    """
+    Count the workers that answer a broadcast ping within `timeout` seconds.
+    
+    Cheaper than `get_worker_stats()` (which waits for full stats from every
+    worker with the default 1s timeout), so it is used by the readiness probe.
+    
+    Args:
+        timeout: Seconds to wait for worker replies
+    
+    Returns:
+        Number of workers that replied
+    """
+    replies = celery_app.control.ping(timeout=timeout)
+    return len(replies or [])
+
+
 __all__ = [
     "submit_task",
+    "submit_tasks_batch",
+    "submit_chain",
     "get_task_result",
     "get_task_status",
     "revoke_task",
     "get_active_tasks",
     "get_worker_stats",
+    "get_worker_count",
 ]
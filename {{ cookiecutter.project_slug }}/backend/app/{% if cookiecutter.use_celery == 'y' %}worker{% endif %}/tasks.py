@@ -25,9 +25,9 @@ def add_numbers(x: int, y: int) -> int:
     Returns:
         Sum of x and y
     """
-    logger.info(f"Adding {x} + {y}")
+    logger.info("Adding %s + %s", x, y)
     result = x + y
-    logger.info(f"Result: {result}")
+    logger.info("Result: %s", result)
     return result
 
 
@@ -42,7 +42,7 @@ def process_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Processed data dictionary
     """
-    logger.info(f"Processing data: {data}")
+    logger.info("Processing data: %s", data)
     
     # Simulate some processing
     time.sleep(2)
@@ -53,7 +53,7 @@ def process_data(data: Dict[str, Any]) -> Dict[str, Any]:
         "processed_at": time.time(),
     }
     
-    logger.info(f"Data processed: {processed}")
+    logger.info("Data processed: %s", processed)
     return processed
 
 
@@ -69,18 +69,22 @@ def long_running_task(self, duration: int = 10) -> Dict[str, Any]:
     Returns:
         Result dictionary with task metadata
     """
-    logger.info(f"Starting long running task for {duration} seconds")
+    logger.info("Starting long running task for %s seconds", duration)
+    
+    # Report progress about 20 times per run; every update is a result backend write
+    update_every = max(1, duration // 20)
     
     for i in range(duration):
         # Update task state with progress
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': i + 1,
-                'total': duration,
-                'status': f'Processing step {i + 1} of {duration}'
-            }
-        )
+        if i % update_every == 0:
+            self.update_state(
+                state='PROGRESS',
+                meta={
+                    'current': i + 1,
+                    'total': duration,
+                    'status': f'Processing step {i + 1} of {duration}'
+                }
+            )
         time.sleep(1)
     
     result = {
@@ -89,7 +93,7 @@ def long_running_task(self, duration: int = 10) -> Dict[str, Any]:
         "task_id": self.request.id,
     }
     
-    logger.info(f"Long running task completed: {result}")
+    logger.info("Long running task completed: %s", result)
     return result
 
 
@@ -108,10 +112,10 @@ def task_with_retry(self, should_fail: bool = False) -> Dict[str, Any]:
     Raises:
         Exception: If should_fail is True and retries exhausted
     """
-    logger.info(f"Running task_with_retry (attempt {self.request.retries + 1})")
+    logger.info("Running task_with_retry (attempt %d)", self.request.retries + 1)
     
     if should_fail and self.request.retries < 2:
-        logger.warning(f"Task failed, retrying... (attempt {self.request.retries + 1})")
+        logger.warning("Task failed, retrying... (attempt %d)", self.request.retries + 1)
         raise self.retry(countdown=5)  # Retry after 5 seconds
     
     result = {
@@ -120,7 +124,7 @@ def task_with_retry(self, should_fail: bool = False) -> Dict[str, Any]:
         "task_id": self.request.id,
     }
     
-    logger.info(f"Task completed successfully: {result}")
+    logger.info("Task completed successfully: %s", result)
     return result
 
 
@@ -3,9 +3,13 @@ Pytest configuration and fixtures for testing.
 
 This file contains shared fixtures that can be used across all tests.
 """
+import asyncio
+import orjson
 import pytest
-from typing import Generator
+import pytest_asyncio
+from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 {% if cookiecutter.use_celery == 'y' %}
@@ -24,13 +28,17 @@ def test_app():
     return app
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client(test_app) -> Generator[TestClient, None, None]:
     """
     Create a test client for making requests to the API.
     
     This fixture provides a TestClient instance that can be used
     to make HTTP requests to the API endpoints.
+    Scope is session-wide, so the app lifespan runs once per test process
+    (once per worker under pytest-xdist). TestClient is an httpx client; keeping
+    it open as a context manager also reuses a single event loop portal for
+    every request instead of starting one per call.
     
     Example:
         def test_endpoint(client):
@@ -68,19 +76,41 @@ def celery_worker_parameters():
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def celery_test_app():
     """
     Provide Celery app instance for testing.
+    
+    Configured once per test session. Tasks run eagerly in-process and use
+    in-memory broker/result backends, so no Redis or RabbitMQ is needed.
     """
     celery_app.conf.update(
+        broker_url='memory://',
+        result_backend='cache+memory://',
         task_always_eager=True,
         task_eager_propagates=True,
+        task_store_eager_result=True,
     )
     return celery_app
 
 
 {% endif %}
+@pytest.fixture(scope="session")
+def json_body():
+    """
+    Provide a helper that decodes a response body with orjson.
+    
+    Example:
+        def test_endpoint(client, json_body):
+            data = json_body(client.get("/health"))
+            assert data["status"] == "healthy"
+    """
+    def decode(response) -> dict:
+        return orjson.loads(response.content)
+    
+    return decode
+
+
 @pytest.fixture(scope="function")
 def sample_data():
     """
@@ -117,28 +147,53 @@ def mock_env_vars(monkeypatch):
 
 
 # Async fixtures for async tests
-@pytest.fixture(scope="function")
-async def async_client(test_app):
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Run async tests on uvloop when it is available.
+    
+    pytest-asyncio uses this policy for every async test and fixture.
+    uvloop is installed with uvicorn[standard]; without it (e.g. on Windows)
+    the default asyncio policy is used.
+    
+    Temporary: event loop policies are deprecated as of Python 3.14 (removal
+    planned for 3.16), and this override only runs quietly because pytest.ini
+    ignores DeprecationWarning. Replace it with pytest-asyncio's loop factory
+    support once the pinned pytest-asyncio provides it, or drop it.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(test_app) -> AsyncGenerator[AsyncClient, None]:
     """
     Create an async test client for testing async endpoints.
     
+    Requests are sent straight to the app through httpx's ASGITransport.
+    The client is shared for the whole session and lives on the session
+    event loop, so tests using it must run on that loop too.
+    
     Example:
-        @pytest.mark.asyncio
+        @pytest.mark.asyncio(loop_scope="session")
         async def test_async_endpoint(async_client):
             response = await async_client.get("/")
             assert response.status_code == 200
     """
-    from httpx import AsyncClient
-    
-    async with AsyncClient(app=test_app, base_url="http://test") as ac:
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as ac:
         yield ac
 
 
 __all__ = [
     "test_app",
     "client",
+    "json_body",
     "sample_data",
     "mock_env_vars",
+    "event_loop_policy",
     "async_client",
     {% if cookiecutter.use_celery == 'y' %}
     "celery_config",
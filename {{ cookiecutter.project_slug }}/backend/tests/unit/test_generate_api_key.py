@@ -0,0 +1,68 @@
+"""
+Unit tests for the API key generation tool.
+"""
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from tools.generate_api_key import write_env_var
+
+
+ENV_VAR = "MASTER_API_KEY_SHA256"
+
+
+@pytest.mark.unit
+class TestWriteEnvVar:
+    """Test cases for write_env_var."""
+    
+    def test_creates_missing_file(self, tmp_path: Path):
+        """
+        Test that a missing env file is created with the assignment.
+        """
+        env_path = tmp_path / ".env"
+        write_env_var(env_path, ENV_VAR, "abc")
+        assert env_path.read_text(encoding="utf-8") == f"{ENV_VAR}='abc'\n"
+    
+    def test_appends_to_existing_file(self, tmp_path: Path):
+        """
+        Test that the assignment is appended and existing lines are kept.
+        """
+        env_path = tmp_path / ".env"
+        env_path.write_text("OTHER=1", encoding="utf-8")
+        write_env_var(env_path, ENV_VAR, "abc")
+        assert env_path.read_text(encoding="utf-8") == f"OTHER=1\n{ENV_VAR}='abc'\n"
+    
+    def test_replaces_every_assignment(self, tmp_path: Path):
+        """
+        Test that duplicate (and exported) assignments are all rewritten.
+        """
+        env_path = tmp_path / ".env"
+        env_path.write_text(
+            f"{ENV_VAR}=old\nOTHER=1\nexport {ENV_VAR} = older\n",
+            encoding="utf-8",
+        )
+        write_env_var(env_path, ENV_VAR, "abc")
+        assert env_path.read_text(encoding="utf-8") == (
+            f"{ENV_VAR}='abc'\nOTHER=1\n{ENV_VAR}='abc'\n"
+        )
+    
+    def test_preserves_file_mode(self, tmp_path: Path):
+        """
+        Test that the original file permissions survive the atomic replace.
+        """
+        env_path = tmp_path / ".env"
+        env_path.write_text("OTHER=1\n", encoding="utf-8")
+        os.chmod(env_path, 0o600)
+        write_env_var(env_path, ENV_VAR, "abc")
+        assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+    
+    def test_leaves_no_temporary_files(self, tmp_path: Path):
+        """
+        Test that only the env file remains in its directory.
+        """
+        env_path = tmp_path / ".env"
+        write_env_var(env_path, ENV_VAR, "abc")
+        write_env_var(env_path, ENV_VAR, "def")
+        assert [p.name for p in tmp_path.iterdir()] == [".env"]
@@ -0,0 +1,127 @@
+"""
+Unit tests for the queue-based logging configuration.
+"""
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core import logging_config
+from app.core.logging_config import _resolve_level, setup_logging, start_logging, stop_logging
+
+
+@pytest.fixture
+def isolated_logging(monkeypatch):
+    """
+    Run a test against its own logging setup and restore the app's afterwards.
+    
+    The module state is swapped out (not stopped), so the app's listener keeps
+    running and gets its root handlers back on teardown.
+    """
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+    monkeypatch.setattr(logging_config, "_queue_listener", None)
+    monkeypatch.setattr(logging_config, "_queue_handler", None)
+    monkeypatch.setattr(logging_config, "_listener_running", False)
+    monkeypatch.setattr(logging_config, "_listener_pid", None)
+    
+    yield
+    
+    stop_logging()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def _setup_file_logging(tmp_path: Path) -> Path:
+    """Configure unbuffered file logging into `tmp_path` and return the log file."""
+    log_file = tmp_path / "app.log"
+    setup_logging(log_level="INFO", log_file_path=str(log_file), buffer_capacity=0)
+    return log_file
+
+
+@pytest.mark.unit
+class TestResolveLevel:
+    """Test cases for log level name resolution."""
+    
+    def test_known_level(self):
+        """
+        Test that level names resolve case-insensitively.
+        """
+        assert _resolve_level("warning") == logging.WARNING
+    
+    def test_unknown_level(self):
+        """
+        Test that unknown level names raise ValueError.
+        """
+        with pytest.raises(ValueError, match="Unknown log level"):
+            _resolve_level("verbose")
+    
+    def test_fallback_without_level_mapping(self, monkeypatch):
+        """
+        Test the getLevelName fallback used before Python 3.11.
+        """
+        monkeypatch.delattr(logging, "getLevelNamesMapping", raising=False)
+        assert _resolve_level("debug") == logging.DEBUG
+        with pytest.raises(ValueError, match="Unknown log level"):
+            _resolve_level("verbose")
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("isolated_logging")
+class TestLoggingListener:
+    """Test cases for starting and stopping the logging listener."""
+    
+    def test_restart_after_stop(self, tmp_path: Path):
+        """
+        Test that records logged while stopped are written once logging restarts.
+        """
+        log_file = _setup_file_logging(tmp_path)
+        stop_logging()
+        logging.getLogger("test").warning("queued while stopped")
+        start_logging()
+        stop_logging()
+        assert "queued while stopped" in log_file.read_text(encoding="utf-8")
+    
+    def test_start_rebuilds_inherited_listener(self, tmp_path: Path):
+        """
+        Test that a running flag inherited from another process does not block start.
+        """
+        log_file = _setup_file_logging(tmp_path)
+        inherited_listener = logging_config._queue_listener
+        # Simulate the state a forked child inherits: flag set, listener owned elsewhere
+        logging_config._listener_pid = -1
+        
+        start_logging()
+        
+        assert logging_config._queue_listener is not inherited_listener
+        assert logging_config._listener_running
+        assert logging_config._listener_pid == os.getpid()
+        logging.getLogger("test").warning("after rebuild")
+        stop_logging()
+        # The "inherited" thread is real here, so stop it as well
+        inherited_listener.stop()
+        assert "after rebuild" in log_file.read_text(encoding="utf-8")
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_logs(self, tmp_path: Path):
+        """
+        Test that a forked child gets a working listener of its own.
+        """
+        log_file = _setup_file_logging(tmp_path)
+        
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                logging.getLogger("test").warning("from child")
+                stop_logging()
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        
+        _, wait_status = os.waitpid(pid, 0)
+        stop_logging()
+        assert os.waitstatus_to_exitcode(wait_status) == 0
+        assert "from child" in log_file.read_text(encoding="utf-8")
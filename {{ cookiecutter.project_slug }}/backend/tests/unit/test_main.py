@@ -1,9 +1,27 @@
 """
 Unit tests for the main FastAPI application.
 """
+import threading
+
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 
+from app.routers.api.v1 import health
+
+
+ROOT_URL = "/"
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
+HEALTH_URL = "/health"
+HEALTH_LIVE_URL = "/health/live"
+HEALTH_READY_URL = "/health/ready"
+MISSING_URL = "/this-does-not-exist"
+
+# Root responds directly (200) or redirects to the docs in development (307)
+_OK_STATUSES: frozenset[int] = frozenset({200, 307})
+_VALID_STATUSES: frozenset[str] = frozenset({"healthy", "alive", "ready"})
+
 
 @pytest.mark.unit
 class TestMainEndpoints:
@@ -15,16 +33,16 @@ class TestMainEndpoints:
         
         In development mode, it should redirect to /docs.
         """
-        response = client.get("/", follow_redirects=False)
+        response = client.get(ROOT_URL, follow_redirects=False)
         
         # Should redirect to docs in development
-        assert response.status_code in [200, 307]
+        assert response.status_code in _OK_STATUSES
     
     def test_docs_endpoint(self, client: TestClient):
         """
         Test that API documentation is accessible.
         """
-        response = client.get("/docs")
+        response = client.get(DOCS_URL)
         assert response.status_code == 200
         assert "swagger" in response.text.lower() or "redoc" in response.text.lower()
     
@@ -32,7 +50,7 @@ class TestMainEndpoints:
         """
         Test that ReDoc documentation is accessible.
         """
-        response = client.get("/redoc")
+        response = client.get(REDOC_URL)
         assert response.status_code == 200
 
 
@@ -52,12 +70,10 @@ class TestApplicationLifecycle:
         Test that CORS middleware is configured.
         """
         # Check if CORSMiddleware is in the middleware stack
-        middleware_types = [type(m) for m in test_app.user_middleware]
-        from fastapi.middleware.cors import CORSMiddleware
-        assert CORSMiddleware in middleware_types
+        assert any(m.cls is CORSMiddleware for m in test_app.user_middleware)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestAsyncEndpoints:
     """Test cases for async endpoints."""
     
@@ -65,8 +81,8 @@ class TestAsyncEndpoints:
         """
         Test the root endpoint using async client.
         """
-        response = await async_client.get("/", follow_redirects=False)
-        assert response.status_code in [200, 307]
+        response = await async_client.get(ROOT_URL, follow_redirects=False)
+        assert response.status_code in _OK_STATUSES
 
 
 @pytest.mark.unit
@@ -77,7 +93,7 @@ class TestErrorHandling:
         """
         Test that non-existent endpoints return 404.
         """
-        response = client.get("/this-does-not-exist")
+        response = client.get(MISSING_URL)
         assert response.status_code == 404
     
     def test_405_method_not_allowed(self, client: TestClient):
@@ -85,7 +101,7 @@ class TestErrorHandling:
         Test that wrong HTTP methods return 405.
         """
         # Try POST on an endpoint that only accepts GET
-        response = client.post("/docs")
+        response = client.post(DOCS_URL)
         assert response.status_code == 405
 
 
@@ -97,32 +113,90 @@ class TestHealthCheck:
         """
         Test that the application is healthy.
         """
-        response = client.get("/")
+        response = client.get(ROOT_URL)
         # As long as we get a response, the app is healthy
-        assert response.status_code in [200, 307]
+        assert response.status_code in _OK_STATUSES
     
-    def test_health_endpoint(self, client: TestClient):
+    def test_health_endpoint(self, client: TestClient, json_body):
         """
         Test the health check endpoint at root level.
         """
-        response = client.get("/health")
+        response = client.get(HEALTH_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] in ["healthy", "alive", "ready"]
+        data = json_body(response)
+        assert data["status"] in _VALID_STATUSES
     
     def test_health_live_endpoint(self, client: TestClient):
         """
         Test the liveness probe endpoint.
         """
-        response = client.get("/health/live")
+        response = client.get(HEALTH_LIVE_URL)
         assert response.status_code == 200
     
-    def test_health_ready_endpoint(self, client: TestClient):
+    @pytest.fixture
+    def readiness_checks(self, monkeypatch):
+        """
+        Replace the readiness service checks and start from an empty cache.
+        
+        Returns a setter taking a {service name: check function} dict.
+        """
+        monkeypatch.setattr(
+            health, "_readiness_cache", {"status": None, "services": None, "updated_at": None}
+        )
+        monkeypatch.setattr(health, "_readiness_inflight", {})
+        
+        def set_checks(checks):
+            monkeypatch.setattr(health, "_READINESS_CHECKS", checks)
+        
+        return set_checks
+    
+    def test_health_ready_endpoint(self, client: TestClient, readiness_checks, json_body):
         """
-        Test the readiness probe endpoint.
+        Test the readiness probe returns 200 when every service is healthy.
         """
-        response = client.get("/health/ready")
+        readiness_checks({
+            "first": lambda: {"status": "healthy"},
+            "second": lambda: {"status": "healthy"},
+        })
+        response = client.get(HEALTH_READY_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert "services" in data
+        data = json_body(response)
+        assert data["status"] == "ready"
+        assert data["services"] == {
+            "first": {"status": "healthy"},
+            "second": {"status": "healthy"},
+        }
+    
+    def test_health_ready_unhealthy_service(self, client: TestClient, readiness_checks, json_body):
+        """
+        Test the readiness probe returns 503 when a service check fails.
+        """
+        def failing_check():
+            raise ConnectionError("refused")
+        
+        readiness_checks({
+            "healthy": lambda: {"status": "healthy"},
+            "broken": failing_check,
+        })
+        response = client.get(HEALTH_READY_URL)
+        assert response.status_code == 503
+        data = json_body(response)
+        assert data["status"] == "not_ready"
+        assert data["services"]["broken"] == {"status": "unhealthy", "error": "refused"}
+    
+    def test_health_ready_timed_out_service(self, client: TestClient, readiness_checks, monkeypatch, json_body):
+        """
+        Test the readiness probe returns 503 when a service check times out.
+        """
+        release = threading.Event()
+        monkeypatch.setattr(health, "_READINESS_CHECK_TIMEOUT", 0.05)
+        readiness_checks({"slow": lambda: release.wait(5) and {"status": "healthy"}})
+        try:
+            response = client.get(HEALTH_READY_URL)
+        finally:
+            release.set()
+        assert response.status_code == 503
+        data = json_body(response)
+        assert data["status"] == "not_ready"
+        assert data["services"]["slow"] == {"status": "unhealthy", "error": "timeout"}
 
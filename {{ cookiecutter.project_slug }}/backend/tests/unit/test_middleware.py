@@ -0,0 +1,196 @@
+"""
+Unit tests for the custom ASGI middleware.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+
+from app.core import middleware
+from app.core.middleware import (
+    ObservabilityMiddleware,
+    RateLimitInfo,
+    RateLimitMiddleware,
+)
+
+
+_SECURITY_HEADER_NAMES: frozenset[str] = frozenset({
+    "X-Content-Type-Options",
+    "X-Frame-Options",
+    "X-XSS-Protection",
+})
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+    
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def _raising_app(exc: Exception):
+    """Build an ASGI app that raises `exc` before starting a response."""
+    async def app(scope, receive, send):
+        raise exc
+    return app
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a manually advanced clock to inject into RateLimitInfo."""
+    return FakeClock()
+
+
+@pytest.mark.unit
+class TestRateLimitInfo:
+    """Test cases for the in-memory rate limit tracker."""
+    
+    def test_blocks_over_limit(self, clock: FakeClock):
+        """
+        Test that requests beyond max_requests in one window are rejected.
+        """
+        limiter = RateLimitInfo(clock=clock)
+        limiter.max_requests = 3
+        assert [limiter.is_allowed("a") for _ in range(4)] == [True, True, True, False]
+        # Other clients have their own budget
+        assert limiter.is_allowed("b")
+    
+    def test_window_expiry(self, clock: FakeClock):
+        """
+        Test that requests older than the window no longer count.
+        """
+        limiter = RateLimitInfo(clock=clock)
+        limiter.max_requests = 2
+        assert limiter.is_allowed("a")
+        clock.now += limiter.window / 2
+        assert limiter.is_allowed("a")
+        assert not limiter.is_allowed("a")
+        
+        # Only the first request has left the window
+        clock.now += limiter.window / 2 + 1
+        assert limiter.is_allowed("a")
+        assert not limiter.is_allowed("a")
+    
+    def test_evicts_least_recently_seen_client(self, clock: FakeClock):
+        """
+        Test that the least recently seen client is evicted at max_clients.
+        """
+        limiter = RateLimitInfo(clock=clock)
+        limiter.max_clients = 2
+        limiter.is_allowed("a")
+        limiter.is_allowed("b")
+        # Touch "a" so "b" becomes the least recently seen
+        limiter.is_allowed("a")
+        limiter.is_allowed("c")
+        assert list(limiter.requests) == ["a", "c"]
+    
+    def test_cleanup_drops_idle_clients(self, clock: FakeClock):
+        """
+        Test that clients idle for a whole window are swept on the next request.
+        """
+        limiter = RateLimitInfo(clock=clock)
+        limiter.is_allowed("idle")
+        clock.now += limiter.window + 1
+        limiter.is_allowed("active")
+        assert list(limiter.requests) == ["active"]
+
+
+@pytest.mark.unit
+class TestObservabilityMiddleware:
+    """Test cases for error handling and response headers."""
+    
+    @pytest.mark.parametrize(
+        ("exc", "status_code", "error"),
+        [
+            (ValueError("bad input"), 400, "Bad Request"),
+            (PermissionError("nope"), 403, "Forbidden"),
+            (FileNotFoundError("missing"), 404, "Not Found"),
+            (RuntimeError("boom"), 500, "Internal Server Error"),
+        ],
+    )
+    def test_error_map(self, exc: Exception, status_code: int, error: str, json_body):
+        """
+        Test that uncaught exceptions map to their status code and error label.
+        """
+        client = TestClient(ObservabilityMiddleware(_raising_app(exc)), raise_server_exceptions=False)
+        response = client.get("/")
+        assert response.status_code == status_code
+        data = json_body(response)
+        assert data["error"] == error
+        assert data["request_id"] == response.headers["X-Request-ID"]
+    
+    def test_internal_error_message(self, json_body):
+        """
+        Test that 500 messages are only masked in production.
+        """
+        client = TestClient(
+            ObservabilityMiddleware(_raising_app(RuntimeError("boom"))),
+            raise_server_exceptions=False,
+        )
+        expected = "An internal error occurred" if middleware.IS_PRODUCTION else "boom"
+        assert json_body(client.get("/"))["message"] == expected
+    
+    def test_headers_on_error_response(self):
+        """
+        Test that error responses carry the request ID, timing and security headers.
+        """
+        client = TestClient(
+            ObservabilityMiddleware(_raising_app(ValueError("bad input"))),
+            raise_server_exceptions=False,
+        )
+        response = client.get("/")
+        assert response.headers["X-Request-ID"]
+        assert float(response.headers["X-Process-Time"]) >= 0
+        assert all(name in response.headers for name in _SECURITY_HEADER_NAMES)
+    
+    def test_headers_on_success_response(self):
+        """
+        Test that successful responses carry the same headers.
+        """
+        client = TestClient(ObservabilityMiddleware(PlainTextResponse("ok")))
+        response = client.get("/")
+        assert response.status_code == 200
+        assert "X-Request-ID" in response.headers
+        assert "X-Process-Time" in response.headers
+        assert all(name in response.headers for name in _SECURITY_HEADER_NAMES)
+
+
+@pytest.mark.unit
+class TestRateLimitMiddleware:
+    """Test cases for the rate limiting middleware."""
+    
+    @pytest.fixture
+    def limiter(self, monkeypatch) -> RateLimitInfo:
+        """
+        Install a fresh rate limiter allowing a single request per window.
+        """
+        limiter = RateLimitInfo()
+        limiter.max_requests = 1
+        monkeypatch.setattr(middleware, "rate_limiter", limiter)
+        return limiter
+    
+    def test_rate_limited_response(self, limiter: RateLimitInfo, json_body):
+        """
+        Test the 429 status and body once the client is over the limit.
+        """
+        client = TestClient(ObservabilityMiddleware(RateLimitMiddleware(PlainTextResponse("ok"))))
+        assert client.get("/items").status_code == 200
+        
+        response = client.get("/items")
+        assert response.status_code == 429
+        assert json_body(response) == {
+            "error": "Too Many Requests",
+            "message": "Rate limit exceeded. Please try again later.",
+            "request_id": response.headers["X-Request-ID"],
+        }
+    
+    def test_health_checks_not_limited(self, limiter: RateLimitInfo):
+        """
+        Test that health check paths bypass the rate limiter.
+        """
+        client = TestClient(RateLimitMiddleware(PlainTextResponse("ok")))
+        for _ in range(3):
+            assert client.get("/health/live").status_code == 200
+        assert not limiter.requests
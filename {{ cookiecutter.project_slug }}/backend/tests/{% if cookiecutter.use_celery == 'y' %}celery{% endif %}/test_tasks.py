@@ -2,8 +2,11 @@
 Tests for Celery tasks.
 """
 import pytest
-from unittest.mock import patch, MagicMock
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import MagicMock
 
+from app.worker import client as worker_client
 from app.worker.tasks import (
     add_numbers,
     process_data,
@@ -12,11 +15,31 @@ from app.worker.tasks import (
 )
 from app.worker.client import (
     submit_task,
+    submit_tasks_batch,
+    submit_chain,
     get_task_status,
     get_task_result,
 )
 
 
+@dataclass
+class FakeAsyncResult:
+    """Plain stand-in for celery.result.AsyncResult (cheaper than MagicMock)."""
+    id: str = ""
+    app: Any = None
+    state: str = "PENDING"
+    result: Any = None
+    info: Any = None
+    is_ready: bool = False
+    is_successful: bool = False
+    
+    def ready(self) -> bool:
+        return self.is_ready
+    
+    def successful(self) -> bool:
+        return self.is_successful
+
+
 @pytest.mark.celery
 class TestCeleryTasks:
     """Test cases for Celery tasks."""
@@ -70,17 +93,28 @@ class TestCeleryTasks:
         output = result.get()
         assert output["status"] == "success"
         assert output["attempts"] == 1
+    
+    def test_submit_tasks_batch_results(self, celery_test_app):
+        """
+        Test that a batch returns one result per task call.
+        """
+        result = submit_tasks_batch("app.worker.tasks.add_numbers", [(1, 2), (3, 4), (5, 6)])
+        
+        assert len(result.results) == 3
+        assert result.get() == [3, 7, 11]
 
 
 @pytest.mark.celery
 class TestCeleryClient:
     """Test cases for Celery client utilities."""
     
-    @patch('app.worker.client.celery_app')
-    def test_submit_task(self, mock_celery_app):
+    def test_submit_task(self, monkeypatch):
         """
         Test task submission via client.
         """
+        mock_celery_app = MagicMock()
+        monkeypatch.setattr(worker_client, "celery_app", mock_celery_app)
+        
         mock_result = MagicMock()
         mock_result.id = "test-task-id"
         mock_celery_app.send_task.return_value = mock_result
@@ -90,75 +124,95 @@ class TestCeleryClient:
         assert result.id == "test-task-id"
         mock_celery_app.send_task.assert_called_once()
     
-    @patch('app.worker.client.AsyncResult')
-    def test_get_task_result(self, mock_async_result):
+    def test_submit_tasks_batch(self, monkeypatch):
         """
-        Test getting task result by ID.
+        Test batch submission builds one group with a signature per call.
         """
+        mock_celery_app = MagicMock()
+        mock_group = MagicMock()
+        monkeypatch.setattr(worker_client, "celery_app", mock_celery_app)
+        monkeypatch.setattr(worker_client, "group", mock_group)
+        
         mock_result = MagicMock()
-        mock_async_result.return_value = mock_result
+        mock_result.id = "test-group-id"
+        mock_group.return_value.apply_async.return_value = mock_result
         
-        result = get_task_result("test-task-id")
+        result = submit_tasks_batch("app.worker.tasks.add_numbers", [(1, 2), (3, 4)])
         
-        assert result == mock_result
-        mock_async_result.assert_called_once_with("test-task-id", app=None)
+        assert result.id == "test-group-id"
+        assert mock_celery_app.signature.call_count == 2
+        # One group of two signatures: one message per task call
+        assert len(mock_group.call_args.args[0]) == 2
+        mock_celery_app.signature.assert_any_call("app.worker.tasks.add_numbers", args=(3, 4))
+        mock_group.return_value.apply_async.assert_called_once()
     
-    @patch('app.worker.client.get_task_result')
-    def test_get_task_status_pending(self, mock_get_result):
+    def test_submit_chain(self, monkeypatch):
         """
-        Test getting status of a pending task.
+        Test chain submission links one signature per task, in order.
         """
-        mock_result = MagicMock()
-        mock_result.state = "PENDING"
-        mock_result.ready.return_value = False
-        mock_get_result.return_value = mock_result
-        
-        status = get_task_status("test-task-id")
+        mock_celery_app = MagicMock()
+        mock_chain = MagicMock()
+        monkeypatch.setattr(worker_client, "celery_app", mock_celery_app)
+        monkeypatch.setattr(worker_client, "chain", mock_chain)
+        mock_celery_app.signature.side_effect = lambda name, args: (name, args)
         
-        assert status["task_id"] == "test-task-id"
-        assert status["state"] == "PENDING"
-        assert status["ready"] is False
-        assert status["result"] is None
+        mock_result = MagicMock()
+        mock_result.id = "test-chain-id"
+        mock_chain.return_value.apply_async.return_value = mock_result
+        
+        result = submit_chain([
+            ("app.worker.tasks.add_numbers", (1, 2)),
+            ("app.worker.tasks.add_numbers", (10,)),
+        ])
+        
+        assert result.id == "test-chain-id"
+        mock_chain.assert_called_once_with(
+            ("app.worker.tasks.add_numbers", (1, 2)),
+            ("app.worker.tasks.add_numbers", (10,)),
+        )
+        mock_chain.return_value.apply_async.assert_called_once()
     
-    @patch('app.worker.client.get_task_result')
-    def test_get_task_status_success(self, mock_get_result):
+    def test_get_task_result(self, monkeypatch):
         """
-        Test getting status of a successful task.
+        Test getting task result by ID.
         """
-        mock_result = MagicMock()
-        mock_result.state = "SUCCESS"
-        mock_result.ready.return_value = True
-        mock_result.successful.return_value = True
-        mock_result.result = 42
-        mock_get_result.return_value = mock_result
+        monkeypatch.setattr(worker_client, "AsyncResult", FakeAsyncResult)
         
-        status = get_task_status("test-task-id")
+        result = get_task_result("test-task-id")
         
-        assert status["task_id"] == "test-task-id"
-        assert status["state"] == "SUCCESS"
-        assert status["ready"] is True
-        assert status["successful"] is True
-        assert status["result"] == 42
+        assert isinstance(result, FakeAsyncResult)
+        assert result.id == "test-task-id"
+        assert result.app is worker_client.celery_app
     
-    @patch('app.worker.client.get_task_result')
-    def test_get_task_status_failure(self, mock_get_result):
-        """
-        Test getting status of a failed task.
-        """
-        mock_result = MagicMock()
-        mock_result.state = "FAILURE"
-        mock_result.ready.return_value = True
-        mock_result.successful.return_value = False
-        mock_result.info = Exception("Task failed")
-        mock_get_result.return_value = mock_result
+    @pytest.mark.parametrize(
+        "fake_result, expected",
+        [
+            pytest.param(
+                FakeAsyncResult(state="PENDING"),
+                {"state": "PENDING", "ready": False, "successful": None, "result": None, "error": None},
+                id="pending",
+            ),
+            pytest.param(
+                FakeAsyncResult(state="SUCCESS", result=42, is_ready=True, is_successful=True),
+                {"state": "SUCCESS", "ready": True, "successful": True, "result": 42, "error": None},
+                id="success",
+            ),
+            pytest.param(
+                FakeAsyncResult(state="FAILURE", info=Exception("Task failed"), is_ready=True),
+                {"state": "FAILURE", "ready": True, "successful": False, "result": None, "error": "Task failed"},
+                id="failure",
+            ),
+        ],
+    )
+    def test_get_task_status(self, monkeypatch, fake_result, expected):
+        """
+        Test getting the status of pending, successful and failed tasks.
+        """
+        monkeypatch.setattr(worker_client, "get_task_result", lambda task_id: fake_result)
         
         status = get_task_status("test-task-id")
         
-        assert status["task_id"] == "test-task-id"
-        assert status["state"] == "FAILURE"
-        assert status["ready"] is True
-        assert status["successful"] is False
-        assert "Task failed" in str(status["error"])
+        assert status == {"task_id": "test-task-id", **expected}
 
 
 @pytest.mark.unit
@@ -1,54 +1,97 @@
+import base64
 import hashlib
+import os
+import re
 import secrets
+import stat
+import sys
+import tempfile
 from pathlib import Path
 
-import typer
-from dotenv import load_dotenv, set_key
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+# typer and rich are imported where they are used, so importing this module (or
+# running it with --quiet) does not pay for loading the CLI and rendering stacks.
 
+# This file lives in <root>/tools/, so parent of parent is root (resolved once)
+_PROJECT_ROOT: Path = Path(__file__).resolve().parents[1]
+_ENV_PATH: Path = _PROJECT_ROOT.parent / ".env" # Place on the .env at the same level as the docker compose file
 
-app = typer.Typer(add_completion=False, no_args_is_help=True)
-console = Console()
 
+def sha256_hex(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
 
-def sha256_hex(value: str) -> str:
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+def write_env_var(env_path: Path, name: str, value: str) -> None:
+    """
+    Set `name` in the env file, replacing every existing assignment or appending one.
+
+    The file is read once, updated in memory and swapped in atomically (temporary
+    file in the same directory + os.replace). The temporary file is created 0600 and
+    takes the original file's mode, so secrets never become world-readable.
+    Values are single-quoted like python-dotenv's set_key.
+    """
+    text = env_path.read_text(encoding="utf-8") if env_path.exists() else ""
+    line = f"{name}='{value}'"
+
+    pattern = re.compile(rf"^(?:export\s+)?{re.escape(name)}\s*=.*$", re.MULTILINE)
+    new_text, count = pattern.subn(lambda _: line, text)
+    if count == 0:
+        if new_text and not new_text.endswith("\n"):
+            new_text += "\n"
+        new_text += line + "\n"
+
+    fd, tmp_name = tempfile.mkstemp(dir=env_path.parent, prefix=env_path.name + ".", suffix=".tmp")
+    try:
+        if env_path.exists():
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(env_path).st_mode))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(new_text)
+        os.replace(tmp_name, env_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def get_project_root() -> Path:
-    # This file lives in <root>/tools/, so parent of parent is root
-    return Path(__file__).resolve().parents[1]
-
-
-@app.command(help="Generate a new API key, print it, and store its SHA-256 in .env")
-def main(
-    bytes_length: int = typer.Option(
-        32,
-        "--bytes",
-        min=16,
-        help="Number of random bytes for key generation (token_urlsafe).",
-    ),
-    env_var: str = typer.Option(
-        "MASTER_API_KEY_SHA256",
-        "--env-var",
-        help="Environment variable name to write the hash to.",
-    ),
-):
-    project_root = get_project_root()
-    env_path = project_root.parent / ".env" # Place on the .env at the same level as the docker compose file
+    return _PROJECT_ROOT
+
 
-    # Load existing .env (non-fatal if missing)
-    load_dotenv(dotenv_path=env_path)
+def generate(bytes_length: int = 32, env_var: str = "MASTER_API_KEY_SHA256", quiet: bool = False) -> str:
+    """
+    Generate a new API key, store its SHA-256 in .env and print it.
+
+    Returns the raw API key.
+    """
+    project_root = get_project_root()
+    env_path = _ENV_PATH
 
-    # Generate secure API key
-    api_key = secrets.token_urlsafe(bytes_length)
-    api_key_hash = sha256_hex(api_key)
+    # Generate secure API key. The hash covers the key text the server receives in
+    # X-API-Key (see app/security/api_key.py), hashed straight from its ASCII bytes.
+    api_key_bytes = base64.urlsafe_b64encode(secrets.token_bytes(bytes_length)).rstrip(b"=")
+    api_key_hash = sha256_hex(api_key_bytes)
+    api_key = api_key_bytes.decode("ascii")
 
     # Persist the hash to .env (creates the file if it does not exist)
-    set_key(str(env_path), env_var, api_key_hash)
+    write_env_var(env_path, env_var, api_key_hash)
+
+    if quiet or not sys.stdout.isatty():
+        # Plain output for scripts and piped output (CI logs): no rich import or rendering
+        print(f"API key: {api_key}\nSHA-256: {api_key_hash}\n.env: {env_path}\nEnv var: {env_var}")
+    else:
+        print_rich_summary(project_root, env_path, env_var, api_key, api_key_hash)
+
+    return api_key
+
+
+def print_rich_summary(project_root: Path, env_path: Path, env_var: str, api_key: str, api_key_hash: str) -> None:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    console = Console()
 
     # Pretty terminal output
     title = Text("API Key Generated", style="bold green")
@@ -78,5 +121,35 @@ def main(
     )
 
 
+def build_app():
+    import typer
+
+    app = typer.Typer(add_completion=False, no_args_is_help=True)
+
+    @app.command(help="Generate a new API key, print it, and store its SHA-256 in .env")
+    def main(
+        bytes_length: int = typer.Option(
+            32,
+            "--bytes",
+            min=16,
+            help="Number of random bytes for key generation (base64url-encoded).",
+        ),
+        env_var: str = typer.Option(
+            "MASTER_API_KEY_SHA256",
+            "--env-var",
+            help="Environment variable name to write the hash to.",
+        ),
+        quiet: bool = typer.Option(
+            False,
+            "--quiet",
+            "-q",
+            help="Print plain text instead of formatted panels (automatic when output is not a terminal).",
+        ),
+    ):
+        generate(bytes_length=bytes_length, env_var=env_var, quiet=quiet)
+
+    return app
+
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    build_app()()